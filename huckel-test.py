@@ -13,6 +13,8 @@ class TestHuckel(unittest.TestCase):
             evals = np.linalg.eigvalsh(m)
 
             self.assertEqual(len(evals), sites)
+            self.assertIs(huckel.lin_polyene_n(sites), m)
+            self.assertFalse(m.flags.writeable)
 
             for n, val in enumerate(evals):
                 expected = -2*np.cos(np.pi * (n+1) / (sites + 1))  # A4 part 1, page 10 eq. (25)
@@ -21,12 +23,27 @@ class TestHuckel(unittest.TestCase):
         for n in (-10, -3, -1, 0):
             self.assertRaises(ValueError, huckel.lin_polyene_n, n)
 
+    def test_lin_polyene_eigvals(self):
+        for sites in (1, 2, 3, 4, 5, 6, 10, 20, 30, 50, 100):
+            evals = huckel.lin_polyene_eigvals(sites)
+            expected = np.linalg.eigvalsh(huckel.lin_polyene_n(sites))
+
+            self.assertEqual(len(evals), sites)
+
+            for val, exp in zip(evals, expected):
+                self.assertEqual(round(val, 10), round(exp, 10))
+
+        for n in (-10, -3, -1, 0):
+            self.assertRaises(ValueError, huckel.lin_polyene_eigvals, n)
+
     def test_cyc_polyene_n(self):
         for sites in (3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 50, 100):
             m = huckel.cyc_polyene_n(sites)
             evals = np.linalg.eigvalsh(m)
 
             self.assertEqual(len(evals), sites)
+            self.assertIs(huckel.cyc_polyene_n(sites), m)
+            self.assertFalse(m.flags.writeable)
 
             expected = []
             n = - sites // 2 + 1
@@ -43,15 +60,28 @@ class TestHuckel(unittest.TestCase):
         for n in (-10, -3, -1, 0, 1, 2):
             self.assertRaises(ValueError, huckel.cyc_polyene_n, n)
 
+    def test_cyc_polyene_eigvals(self):
+        for sites in (3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 50, 100):
+            evals = huckel.cyc_polyene_eigvals(sites)
+            expected = np.linalg.eigvalsh(huckel.cyc_polyene_n(sites))
+
+            self.assertEqual(len(evals), sites)
+
+            for val, exp in zip(evals, expected):
+                self.assertEqual(round(val, 10), round(exp, 10))
+
+        for n in (-10, -3, -1, 0, 1, 2):
+            self.assertRaises(ValueError, huckel.cyc_polyene_eigvals, n)
+
     def test_get_eigenvalues_with_degeneracies(self):
         self.assertEqual(huckel.get_eigenvalues_with_degeneracies((2, 2, 2, 2, 2)), [(2, 5)])
         self.assertEqual(huckel.get_eigenvalues_with_degeneracies((2, 2, 2, 3, 3)), [(2, 3), (3, 2)])
         self.assertEqual(huckel.get_eigenvalues_with_degeneracies((7, 8, 9)), [(7, 1), (8, 1), (9, 1)])
+        self.assertEqual(huckel.get_eigenvalues_with_degeneracies(e for e in (1.0, 1.0, 2.0)), [(1.0, 2), (2.0, 1)])
 
         # Check the degeneracies for some cyclic poly-enes.
         for sites in (3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 50, 100):
-            m = huckel.cyc_polyene_n(sites)
-            evals = huckel.get_eigenvalues_with_degeneracies(np.linalg.eigvalsh(m))
+            evals = huckel.get_eigenvalues_with_degeneracies(huckel.cyc_polyene_eigvals(sites))
 
             n = 0
 
@@ -64,15 +94,45 @@ class TestHuckel(unittest.TestCase):
                 n += degen
 
     def test_platonic(self):
-        for n in (4, 6, 8, 12, 20):
+        for n, degree in ((4, 3), (6, 4), (8, 3), (12, 5), (20, 3)):
             m = huckel.platonic(n)
             evals = np.linalg.eigvalsh(m)
 
             self.assertEqual(len(evals), n)
+            self.assertIs(huckel.platonic(n), m)
+            self.assertFalse(m.flags.writeable)
+            self.assertTrue(np.array_equal(m, m.T))
+
+            for row in m:
+                self.assertEqual(row.sum(), -degree)
 
         for n in (3, 5, 9, 10):
             self.assertRaises(ValueError, huckel.platonic, n)
 
+    def test_buckyball(self):
+        m = huckel.buckyball()
+
+        self.assertEqual(m.shape, (60, 60))
+        self.assertTrue(np.array_equal(m, m.T))
+
+        # Every carbon in C60 is bonded to exactly three others.
+        for row in m:
+            self.assertEqual(row.sum(), -3)
+
+        self.assertEqual(len(np.linalg.eigvalsh(m)), 60)
+
+    def test_cached_eigvalsh(self):
+        m = huckel.buckyball()
+
+        self.assertIs(huckel.buckyball(), m)
+        self.assertFalse(m.flags.writeable)
+
+        evals = huckel._cached_eigvalsh(huckel.buckyball)
+
+        self.assertIs(huckel._cached_eigvalsh(huckel.buckyball), evals)
+        self.assertFalse(evals.flags.writeable)
+        self.assertEqual(len(evals), 60)
+
 
 if __name__ == '__main__':
     unittest.main()
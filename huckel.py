@@ -1,25 +1,44 @@
 #!/usr/bin/env python3
 
+import functools
 import numpy as np
 import networkx as nx
+import scipy.linalg
 import sys
 
-from typing import Iterable, Tuple, List
+from typing import Callable, Iterable, Tuple, List
 
 
+@functools.lru_cache(maxsize=32)
 def lin_polyene_n(n: int) -> np.ndarray:
     """
     Returns the hamiltonian matrix for a linear poly-ene with n sites. The matrix entries are as per the Huckel
-    approximation, with alpha = 0 and beta = -1.
+    approximation, with alpha = 0 and beta = -1. The matrix is cached, so the returned array is read-only.
     """
     if n < 1:
         raise ValueError("A linear poly-ene must have at least 1 site.")
 
-    m = np.array([[-1 if i == j - 1 or i == j + 1 else 0 for i in range(n)] for j in range(n)])
+    m = np.zeros((n, n), dtype=np.float64, order='F')
+    idx = np.arange(n - 1)
+    m[idx, idx + 1] = -1.0
+    m[idx + 1, idx] = -1.0
+    m.flags.writeable = False
 
     return m
 
 
+def lin_polyene_eigvals(n: int) -> np.ndarray:
+    """
+    Returns the sorted Huckel eigenvalues for a linear poly-ene with n sites, using the closed form
+    E_k = -2 cos(k pi / (n + 1)) for k = 1, ..., n, rather than diagonalising the hamiltonian.
+    """
+    if n < 1:
+        raise ValueError("A linear poly-ene must have at least 1 site.")
+
+    return -2 * np.cos(np.pi * np.arange(1, n + 1) / (n + 1))
+
+
+@functools.lru_cache(maxsize=32)
 def cyc_polyene_n(n: int) -> np.ndarray:
     """
     Returns the hamiltonian matrix for a cyclic poly-ene with n sites. This is just the same as for a linear poly-ene,
@@ -28,18 +47,49 @@ def cyc_polyene_n(n: int) -> np.ndarray:
     if n < 3:
         raise ValueError("A cyclic poly-ene must have at least 3 sites.")
 
-    m = lin_polyene_n(n)
-    m[0][n-1] = -1
-    m[n-1][0] = -1
+    m = np.zeros((n, n), dtype=np.float64, order='F')
+    idx = np.arange(n)
+    m[idx, (idx + 1) % n] = -1.0
+    m[idx, (idx - 1) % n] = -1.0
+    m.flags.writeable = False
+
+    return m
+
+
+def cyc_polyene_eigvals(n: int) -> np.ndarray:
+    """
+    Returns the sorted Huckel eigenvalues for a cyclic poly-ene with n sites, using the closed form
+    E_k = -2 cos(2 k pi / n) for k = -n/2 + 1, ..., n/2 (rounded down), rather than diagonalising the hamiltonian.
+    """
+    if n < 3:
+        raise ValueError("A cyclic poly-ene must have at least 3 sites.")
+
+    return np.sort(-2 * np.cos(2 * np.pi * np.arange(-n // 2 + 1, n // 2 + 1) / n))
+
+
+def _adj_from_edges(n: int, edges: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """
+    Returns the (read-only) hamiltonian matrix for n sites joined by the given bonds, i.e. minus the adjacency matrix of
+    the molecular graph.
+    """
+    i, j = np.asarray(list(edges), dtype=np.intp).T
+
+    m = np.zeros((n, n), dtype=np.float64, order='F')
+    m[i, j] = -1.0
+    m[j, i] = -1.0
+    m.flags.writeable = False
 
     return m
 
 
+@functools.lru_cache(maxsize=None)
 def platonic(n: int) -> np.ndarray:
     """
     Returns the hamiltonian matrix corresponding to the (sp2-hybridised) platonic solid with n vertices.
     The possible values are n = 4, 6, 8, 12, 20.  Use the pre-defined graphs from networkx, as there is no nice way of
     generating them algorithmically (they are just definitions, after all).
+
+    Hamiltonian matrices are cached, so the returned array is read-only.
     """
 
     if n == 4:
@@ -55,10 +105,10 @@ def platonic(n: int) -> np.ndarray:
     else:
         raise ValueError("Unknown platonic solid")
 
-    mat = nx.adjacency_matrix(g)
-    return - mat.todense()
+    return _adj_from_edges(n, g.edges())
 
 
+@functools.lru_cache(maxsize=None)
 def buckyball() -> np.ndarray:
     """
     Return the hamiltonian matrix (in the Huckel approximation) for buckminsterfullerene, C60. Like for the platonic
@@ -81,10 +131,18 @@ def buckyball() -> np.ndarray:
              (54, 55), (54, 56), (55, 57), (56, 58), (57, 59), (58, 59)
              ]
 
-    g = nx.Graph()
-    g.add_edges_from(edges)
+    return _adj_from_edges(60, edges)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_eigvalsh(builder: Callable[..., np.ndarray], *args) -> np.ndarray:
+    """
+    Returns the sorted eigenvalues of the hamiltonian matrix builder(*args), caching them by (builder, args).
+    """
+    evals = scipy.linalg.eigvalsh(builder(*args), check_finite=False, driver='evr')
+    evals.flags.writeable = False
 
-    return -nx.adjacency_matrix(g).todense()
+    return evals
 
 
 def get_eigenvalues_with_degeneracies(evals: Iterable[float]) -> List[Tuple[float, int]]:
@@ -92,25 +150,19 @@ def get_eigenvalues_with_degeneracies(evals: Iterable[float]) -> List[Tuple[floa
     Given a set of sorted eigenvalues (possibly including degenerate eigenvalues), return a list of
     (eigenvalue, degeneracy) pairs, with eigenvalues represented as floats rounded to 3dp.
     """
-    cur = None
-    count = 0
-    result = []
+    if not isinstance(evals, np.ndarray):
+        evals = list(evals)
 
-    for e in evals:
-        e = round(e, 3)
+    rounded = np.round(np.asarray(evals, dtype=np.float64), 3)
 
-        if e == cur:
-            count += 1
-        else:
-            if cur is not None:
-                result.append((cur, count))
-            cur = e
-            count = 1
+    if len(rounded) == 0:
+        return []
 
-    if count > 0:
-        result.append((cur, count))
+    # Run-length encode the sorted, rounded eigenvalues: find the index at which each level starts, plus a sentinel
+    # at the end, so that the degeneracies are the differences between consecutive boundaries.
+    bounds = np.flatnonzero(np.concatenate(([True], rounded[1:] != rounded[:-1], [True])))
 
-    return result
+    return list(zip(rounded[bounds[:-1]].tolist(), np.diff(bounds).tolist()))
 
 
 def print_eigenvalues(evals: List[Tuple[float, int]]) -> None:
@@ -118,29 +170,28 @@ def print_eigenvalues(evals: List[Tuple[float, int]]) -> None:
     Format and print a sorted (in ascending order of eigenvalue) list of (eigenvalue, degeneracy) pairs as an
     energy-level diagram.
     """
-    max_degen = np.amax([e[1] for e in evals])
+    max_degen = max(degen for _, degen in evals)
     line_length = 4 * max_degen - 2
     count = 0
+    lines = []
+
+    # Levels of the same degeneracy share a centred bar, so render each one only once.
+    bars = {}
+    for degen in set(d for _, d in evals):
+        spacing = ' ' * ((line_length - (4 * degen - 2)) // 2)
+        bars[degen] = spacing + '――  ' * degen + spacing
 
     for val, degen in reversed(evals):
         count += degen
-        line = ''
-        spacing = (line_length - (4 * degen - 2)) // 2
-        line += ' ' * spacing
-        line += '――  ' * degen
-        line += ' ' * spacing
-        if val < 0:
-            line += '-'
-        else:
-            line += ' '
-        line += str(abs(val))
-        print(line)
-        print()
+        sign = '-' if val < 0 else ' '
+        lines.append(f'{bars[degen]}{sign}{abs(val)}\n\n')
 
     if count == 1:
-        print("1 orbital.")
+        lines.append("1 orbital.\n")
     else:
-        print("%d orbitals." % count)
+        lines.append("%d orbitals.\n" % count)
+
+    sys.stdout.write(''.join(lines))
 
 
 def print_usage() -> None:
@@ -155,25 +206,30 @@ def main() -> None:
         print_usage()
         return
 
-    matrix = None
+    evals = None
+
+    spectra = {
+        '-l': lin_polyene_eigvals, '--linear-polyene': lin_polyene_eigvals,
+        '-c': cyc_polyene_eigvals, '--cyclic-polyene': cyc_polyene_eigvals
+    }
 
     arguments = {
-        '-l': lin_polyene_n, '--linear-polyene': lin_polyene_n,
-        '-c': cyc_polyene_n, '--cyclic-polyene': cyc_polyene_n,
         '-p': platonic, '--platonic': platonic
     }
 
-    if sys.argv[1] in arguments:
-        try:
-            matrix = arguments.get(sys.argv[1])(int(sys.argv[2]))
-        except (IndexError, ValueError):
-            print_usage()
-            return
-    elif sys.argv[1] == '-b' or sys.argv[1] == '--buckyball':
-        matrix = buckyball()
-
-    if matrix is not None:
-        print_eigenvalues(get_eigenvalues_with_degeneracies(np.linalg.eigvalsh(matrix)))
+    try:
+        if sys.argv[1] in spectra:
+            evals = spectra.get(sys.argv[1])(int(sys.argv[2]))
+        elif sys.argv[1] in arguments:
+            evals = _cached_eigvalsh(arguments.get(sys.argv[1]), int(sys.argv[2]))
+        elif sys.argv[1] == '-b' or sys.argv[1] == '--buckyball':
+            evals = _cached_eigvalsh(buckyball)
+    except (IndexError, ValueError):
+        print_usage()
+        return
+
+    if evals is not None:
+        print_eigenvalues(get_eigenvalues_with_degeneracies(evals))
     else:
         print_usage()
 